@@ -5,22 +5,96 @@ enforce constraints, to produce helpful error messages, to generate user-friendl
 documentation, or to output default configuration with helpful comments.
 """
 
-from schemaspec.adapters import (
-    BaseType,
-    BoolAdapter,
-    FloatAdapter,
-    IntAdapter,
-    ListAdapter,
-    PathAdapter,
-    StringAdapter,
-    SubgroupTypeAdapter,
-    TypeAdapter,
-)
-from schemaspec.metafields import (
-    METADATA_KEY,
-    SchemaItemField,
-    SchemaMetaField,
-    SchemaTableField,
-    schema_from,
-)
-from schemaspec.schema import OnConversionError, Schema, SchemaItem, SchemaTable
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from schemaspec.adapters import (
+        BaseType,
+        BoolAdapter,
+        FloatAdapter,
+        IntAdapter,
+        ListAdapter,
+        PathAdapter,
+        StringAdapter,
+        SubgroupTypeAdapter,
+        TypeAdapter,
+    )
+    from schemaspec.metafields import (
+        METADATA_KEY,
+        SchemaItemField,
+        SchemaMetaField,
+        SchemaTableField,
+        schema_from,
+    )
+    from schemaspec.schema import (
+        OnConversionError,
+        Schema,
+        SchemaItem,
+        SchemaTable,
+        UnexpectedKeysError,
+    )
+
+_LAZY_ATTRS: dict[str, str] = {
+    "BaseType": "schemaspec.adapters",
+    "BoolAdapter": "schemaspec.adapters",
+    "FloatAdapter": "schemaspec.adapters",
+    "IntAdapter": "schemaspec.adapters",
+    "ListAdapter": "schemaspec.adapters",
+    "PathAdapter": "schemaspec.adapters",
+    "StringAdapter": "schemaspec.adapters",
+    "SubgroupTypeAdapter": "schemaspec.adapters",
+    "TypeAdapter": "schemaspec.adapters",
+    "METADATA_KEY": "schemaspec.metafields",
+    "SchemaItemField": "schemaspec.metafields",
+    "SchemaMetaField": "schemaspec.metafields",
+    "SchemaTableField": "schemaspec.metafields",
+    "schema_from": "schemaspec.metafields",
+    "OnConversionError": "schemaspec.schema",
+    "Schema": "schemaspec.schema",
+    "SchemaItem": "schemaspec.schema",
+    "SchemaTable": "schemaspec.schema",
+    "UnexpectedKeysError": "schemaspec.schema",
+}
+"""Public name to the submodule defining it; imported on first access."""
+
+_SUBMODULES = frozenset(("adapters", "metafields", "schema"))
+"""Submodules reachable as package attributes, imported on first access."""
+
+__all__ = [
+    "BaseType",
+    "BoolAdapter",
+    "FloatAdapter",
+    "IntAdapter",
+    "ListAdapter",
+    "PathAdapter",
+    "StringAdapter",
+    "SubgroupTypeAdapter",
+    "TypeAdapter",
+    "METADATA_KEY",
+    "SchemaItemField",
+    "SchemaMetaField",
+    "SchemaTableField",
+    "schema_from",
+    "OnConversionError",
+    "Schema",
+    "SchemaItem",
+    "SchemaTable",
+    "UnexpectedKeysError",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        # Importing a submodule binds it on this package as well.
+        return importlib.import_module(f"{__name__}.{name}")
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_ATTRS.keys() | _SUBMODULES)
@@ -19,19 +19,60 @@ __all__ = [
 
 import dataclasses
 import pathlib
-from typing import Protocol, override
+from typing import Callable, cast, override
 
 type BaseType = str | int | float | bool | list | dict
 """Primative types which can be implicitly converted to and from Python."""
 
+_SHARED_ADAPTERS: dict[type, "TypeAdapter"] = {}
+"""Instances shared by built-in adapters constructed without choices."""
 
-class TypeAdapter[T](Protocol):
+
+def _shared_or_new[
+    A: "TypeAdapter"
+](cls: type[A], base: type, choices: tuple = ()) -> A:
+    """Shared instance of `base` if `cls` is exactly `base` and `choices` is empty.
+
+    Adapters do not change after initialization, so a single instance can stand in
+    for every choice-free construction. Subclasses always get a new instance.
+    """
+    if choices or cls is not base:
+        return object.__new__(cls)
+    shared = _SHARED_ADAPTERS.get(cls)
+    if not isinstance(shared, cls):
+        shared = object.__new__(cls)
+        _SHARED_ADAPTERS[cls] = shared
+    return shared
+
+
+def _exporter[T](adapter: "TypeAdapter[T]") -> Callable[[T], str | None]:
+    """`adapter._export_unchecked` for built-in adapters, otherwise `adapter.export`.
+
+    Subclasses and duck-typed adapters may only override `export()`, so only the
+    built-in classes are trusted to format a value without validating it.
+    """
+    if type(adapter) in _BUILTIN_ADAPTERS:
+        return adapter._export_unchecked
+    return adapter.export
+
+
+class TypeAdapter[T]:
     """Convert values to and from schema and python."""
 
-    @property
-    def type_spec(self) -> str:
-        """Text to briefly show what valid input values are."""
-        ...
+    __slots__ = ()
+
+    type_spec: str
+    """Text to briefly show what valid input values are."""
+    _convert_types: tuple[type, ...] | None = None
+    """Input types, subclasses included, `convert()` may accept; `None` if not known.
+
+    Only honoured on the class that declares it, never on subclasses.
+    """
+    _export_types: tuple[type, ...] | None = None
+    """Value types, subclasses included, `export()` may accept; `None` if not known.
+
+    Only honoured on the class that declares it, never on subclasses.
+    """
 
     def is_valid(self, value: T) -> bool:
         """True if `value` is valid."""
@@ -39,52 +80,105 @@ class TypeAdapter[T](Protocol):
 
     def export(self, value: T) -> str | None:
         """Export `value` to valid string representation."""
-        ...
+        raise NotImplementedError
+
+    def _export_unchecked(self, value: T) -> str | None:
+        """Like `export()`, but `value` is already known to be valid."""
+        return self.export(value)
 
     def convert(self, value: BaseType) -> T | None:
         """Convert primative to full type."""
-        ...
+        raise NotImplementedError
 
 
 class ListAdapter[T](TypeAdapter[list[T]]):
     """List type adapter schema. Every element must be of type `T`."""
 
+    __slots__ = (
+        "_element_adapter",
+        "_element_export",
+        "_element_type",
+        "_validate_once",
+        "type_spec",
+    )
+
     _element_adapter: TypeAdapter[T]
     """Element-wise adapter."""
+    _validate_once: bool
+    """True if `export()` may validate the whole list up front, then format each
+    element unchecked; only built-in element adapters are trusted to do so."""
+    _element_export: Callable[[T], str | None]
+    """Formats an element; skips validation only if `_validate_once` is set."""
+    _element_type: type | None
+    """Element type when `_element_adapter` only checks the type.
+
+    Lists whose elements are all exactly of this type skip `_element_adapter`; any
+    other list falls back to it.
+    """
+
+    _convert_types = (list,)
+    _export_types = (list,)
 
     def __init__(self, element_adapter: TypeAdapter[T]):
         self._element_adapter = element_adapter
-
-    @property
-    @override
-    def type_spec(self) -> str:
-        return f"[{self._element_adapter.type_spec},]"
+        # A nested `ListAdapter` is only trusted if its own elements are.
+        self._validate_once = type(element_adapter) in _BUILTIN_ADAPTERS and getattr(
+            element_adapter, "_validate_once", True
+        )
+        self._element_export = (
+            element_adapter._export_unchecked
+            if self._validate_once
+            else element_adapter.export
+        )
+        self._element_type = None
+        primitive = _PRIMITIVE_TYPES.get(type(element_adapter))
+        if (
+            primitive is not None
+            and isinstance(element_adapter, SubgroupTypeAdapter)
+            and not element_adapter.choices
+        ):
+            self._element_type = primitive
+        self.type_spec = f"[{element_adapter.type_spec},]"
 
     @override
     def is_valid(self, value: list[T]) -> bool:
+        if self._element_type is not None and {self._element_type}.issuperset(
+            map(type, value)
+        ):
+            return True
         return all(map(self._element_adapter.is_valid, value))
 
     @override
     def export(self, value: list[T]) -> str | None:
-        result = []
+        if self._validate_once and not self.is_valid(value):
+            return None
+        return self._export_unchecked(value)
+
+    @override
+    def _export_unchecked(self, value: list[T]) -> str | None:
+        export = self._element_export
+        result: list[str] = []
+        append = result.append
         for item in value:
-            v = self._element_adapter.export(item)
-            if not isinstance(v, str):
+            item_str = export(item)
+            if item_str is None:
                 return None
-            result.append(v)
-        return f"[{", ".join(result)}]"
+            append(item_str)
+        return "[" + ", ".join(result) + "]"
 
     @override
     def convert(self, value: BaseType) -> list[T] | None:
         if not isinstance(value, list):
             return None
-        result = []
-        for item in value:
-            v = self._element_adapter.convert(item)
-            if v is None:
-                return None
-            result.append(v)
-        return result
+        if self._element_type is not None and {self._element_type}.issuperset(
+            map(type, value)
+        ):
+            return list(value)
+        convert = self._element_adapter.convert
+        result = [convert(item) for item in value]
+        if None in result:
+            return None
+        return cast(list[T], result)
 
 
 class SubgroupTypeAdapter[T](TypeAdapter[T]):
@@ -93,63 +187,100 @@ class SubgroupTypeAdapter[T](TypeAdapter[T]):
     If no choices are specified, act just like `TypeAdapter`.
     """
 
+    __slots__ = ("__choices", "_members", "type_spec")
+
+    _members: frozenset[T] | tuple[T, ...] | None
+    """Container for membership tests against `choices`; `None` if unconstrained."""
+
     def __init__(self, default_type_spec: str, choices: tuple[T, ...] = tuple()):
         """Initialize `choices` and `type_spec`.
 
         :param `default_type_spec`: Value for `type_spec` when `choices` is emtpy.
         :param `choices`: Sets the `choices` value.
         """
+        if hasattr(self, "_members"):
+            # A shared instance returned by `__new__()` is already initialized.
+            return
         self.__choices = choices
+        self._members = self.__members_of(choices)
         self.__init_type_spec(default_type_spec)
 
+    def __getnewargs__(self) -> tuple[tuple[T, ...]]:
+        # Copies must not resolve to a shared choice-free instance.
+        return (self.__choices,)
+
     @property
     def choices(self) -> tuple[T, ...]:
         """Defines the valid choices of a value; empty means no constraint."""
         return self.__choices
 
+    @staticmethod
+    def __members_of(
+        choices: tuple[T, ...],
+    ) -> frozenset[T] | tuple[T, ...] | None:
+        """Container used for membership tests; `None` when there is no constraint."""
+        if not choices:
+            return None
+        # NaN never equals itself, keep such choices in a tuple so membership stays
+        # an explicit scan rather than relying on hash/identity details.
+        if any(choice != choice for choice in choices):
+            return choices
+        try:
+            return frozenset(choices)
+        except TypeError:
+            return choices
+
     def __init_type_spec(self, default_spec: str) -> None:
-        self.__type_spec = default_spec
         if not self.choices:
+            self.type_spec = default_spec
             return
-        s = []
+        export = _exporter(self)
+        specs: list[str] = []
         for choice in self.choices:
-            result = self.export(choice)
-            if result is None:
+            spec = export(choice) if self.is_valid(choice) else None
+            if spec is None:
                 raise ValueError("Choice is not a valid type")
-            s.append(result)
-        self.__type_spec = " | ".join(s)
-
-    @property
-    @override
-    def type_spec(self) -> str:
-        return self.__type_spec
+            specs.append(spec)
+        self.type_spec = " | ".join(specs)
 
     @override
     def is_valid(self, value: T) -> bool:
-        return not self.choices or value in self.choices
+        return self._members is None or value in self._members
 
 
 @dataclasses.dataclass
 class BoolAdapter(SubgroupTypeAdapter[bool]):
     """Bool type schema."""
 
+    __slots__ = ()
+
+    _convert_types = (bool,)
+    _export_types = (bool,)
+
+    def __new__(cls, choices: tuple[bool, ...] = ()):
+        return _shared_or_new(cls, BoolAdapter, choices)
+
     def __init__(self, choices: tuple[bool, ...] = ()):
         super().__init__(default_type_spec="true | false", choices=choices)
 
     @override
     def is_valid(self, value: bool) -> bool:
-        return isinstance(value, bool) and super().is_valid(value)
+        return type(value) is bool and (self._members is None or value in self._members)
 
     @override
     def export(self, value: bool) -> str | None:
         if not self.is_valid(value):
             return None
+        return self._export_unchecked(value)
+
+    @override
+    def _export_unchecked(self, value: bool) -> str:
         return "true" if value else "false"
 
     @override
     def convert(self, value: BaseType) -> bool | None:
         """Convert primative to full type."""
-        if not isinstance(value, bool) or not self.is_valid(value):
+        if type(value) is not bool or not self.is_valid(value):
             return None
         return value
 
@@ -158,18 +289,33 @@ class BoolAdapter(SubgroupTypeAdapter[bool]):
 class IntAdapter(SubgroupTypeAdapter[int]):
     """Int type schema."""
 
+    __slots__ = ()
+
+    _convert_types = (int,)
+    _export_types = (int,)
+
+    def __new__(cls, choices: tuple[int, ...] = ()):
+        return _shared_or_new(cls, IntAdapter, choices)
+
     def __init__(self, choices: tuple[int, ...] = ()):
         super().__init__(default_type_spec="<integer>", choices=choices)
 
     @override
     def is_valid(self, value: int) -> bool:
-        return isinstance(value, int) and super().is_valid(value)
+        return (
+            type(value) is int
+            or (isinstance(value, int) and not isinstance(value, bool))
+        ) and (self._members is None or value in self._members)
 
     @override
     def export(self, value: int) -> str | None:
         if not self.is_valid(value):
             return None
-        return f"{value}"
+        return self._export_unchecked(value)
+
+    @override
+    def _export_unchecked(self, value: int) -> str:
+        return str(value)
 
     @override
     def convert(self, value: BaseType) -> int | None:
@@ -183,18 +329,32 @@ class IntAdapter(SubgroupTypeAdapter[int]):
 class FloatAdapter(SubgroupTypeAdapter[float]):
     """Float type schema."""
 
+    __slots__ = ()
+
+    _convert_types = (float,)
+    _export_types = (float,)
+
+    def __new__(cls, choices: tuple[float, ...] = ()):
+        return _shared_or_new(cls, FloatAdapter, choices)
+
     def __init__(self, choices: tuple[float, ...] = ()):
         super().__init__(default_type_spec="<float>", choices=choices)
 
     @override
     def is_valid(self, value: float) -> bool:
-        return isinstance(value, float) and super().is_valid(value)
+        return (type(value) is float or isinstance(value, float)) and (
+            self._members is None or value in self._members
+        )
 
     @override
     def export(self, value: float) -> str | None:
         if not self.is_valid(value):
             return None
-        return f"{value}"
+        return self._export_unchecked(value)
+
+    @override
+    def _export_unchecked(self, value: float) -> str:
+        return str(value)
 
     @override
     def convert(self, value: BaseType) -> float | None:
@@ -208,18 +368,32 @@ class FloatAdapter(SubgroupTypeAdapter[float]):
 class StringAdapter(SubgroupTypeAdapter[str]):
     """String type schema."""
 
+    __slots__ = ()
+
+    _convert_types = (str,)
+    _export_types = (str,)
+
+    def __new__(cls, choices: tuple[str, ...] = ()):
+        return _shared_or_new(cls, StringAdapter, choices)
+
     def __init__(self, choices: tuple[str, ...] = ()):
         super().__init__(default_type_spec='"<string>"', choices=choices)
 
     @override
     def is_valid(self, value: str) -> bool:
-        return isinstance(value, str) and super().is_valid(value)
+        return (type(value) is str or isinstance(value, str)) and (
+            self._members is None or value in self._members
+        )
 
     @override
     def export(self, value: str) -> str | None:
         if not self.is_valid(value):
             return None
-        return f'"{value}"'
+        return self._export_unchecked(value)
+
+    @override
+    def _export_unchecked(self, value: str) -> str:
+        return '"' + value + '"'
 
     @override
     def convert(self, value: BaseType) -> str | None:
@@ -232,20 +406,33 @@ class StringAdapter(SubgroupTypeAdapter[str]):
 class PathAdapter(TypeAdapter[pathlib.Path]):
     """Path type schema."""
 
-    @property
-    @override
-    def type_spec(self) -> str:
-        return '"<path>"'
+    __slots__ = ()
+
+    type_spec = '"<path>"'
+    _convert_types = (str,)
+    _export_types = (pathlib.Path,)
+
+    def __new__(cls):
+        return _shared_or_new(cls, PathAdapter)
 
     @override
     def is_valid(self, value: pathlib.Path) -> bool:
-        return isinstance(value, pathlib.Path) and super().is_valid(value)
+        value_type = type(value)
+        return (
+            value_type is pathlib.PosixPath
+            or value_type is pathlib.WindowsPath
+            or isinstance(value, pathlib.Path)
+        ) and super().is_valid(value)
 
     @override
     def export(self, value: pathlib.Path) -> str | None:
-        if not isinstance(value, pathlib.Path) or not self.is_valid(value):
+        if not self.is_valid(value):
             return None
-        return f'"{value}"'
+        return self._export_unchecked(value)
+
+    @override
+    def _export_unchecked(self, value: pathlib.Path) -> str:
+        return '"' + str(value) + '"'
 
     @override
     def convert(self, value: BaseType) -> pathlib.Path | None:
@@ -254,3 +441,17 @@ class PathAdapter(TypeAdapter[pathlib.Path]):
             return None
         path = pathlib.Path(value)
         return path if self.is_valid(path) else None
+
+
+_PRIMITIVE_TYPES: dict[type, type] = {
+    BoolAdapter: bool,
+    IntAdapter: int,
+    FloatAdapter: float,
+    StringAdapter: str,
+}
+"""Adapters whose validity, without choices, is exactly a type check."""
+
+_BUILTIN_ADAPTERS: frozenset[type] = frozenset(
+    (BoolAdapter, IntAdapter, FloatAdapter, StringAdapter, PathAdapter, ListAdapter)
+)
+"""Adapters whose `_export_unchecked()` is known to match their `export()`."""
@@ -64,23 +64,33 @@ __all__ = [
 ]
 
 import dataclasses
-from typing import Protocol, Self
+import weakref
+from typing import Any, Callable, NamedTuple, Self
 
 from schemaspec import adapters, schema
 
 METADATA_KEY = "schemaspec"
 """dataclass field metadata key; prevents clashing with other extensions."""
 
+_SCHEMA_ATTR = "__schemaspec_schema__"
+"""Class attribute holding the schema `schema_from()` created for that class.
 
-class SchemaMetaField(Protocol):
+Kept on the class itself: the schema refers back to the class, so a weak mapping
+keyed by the class would keep it alive forever.
+"""
+
+
+class SchemaMetaField:
     """Field within a `dataclasses.Field` metadata helps configures schema."""
 
+    __slots__ = ()
+
     def metadata(self) -> dict[str, Self]:
         """Converts this into a dict to be used in a dataclass field's metadata."""
         return {METADATA_KEY: self}
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SchemaItemField(SchemaMetaField):
     """Metadata corresponding to `schemaspec.schema.SchemaItem`."""
 
@@ -89,8 +99,12 @@ class SchemaItemField(SchemaMetaField):
     description: str | None = None
     """Brief description, forwarded to `schemaspec.schema.SchemaItem` constructor."""
 
+    def __post_init__(self):
+        if type(self.possible_values) is not tuple:
+            object.__setattr__(self, "possible_values", tuple(self.possible_values))
+
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SchemaTableField(SchemaMetaField):
     """Metadata corresponding to `schemaspec.schema.SchemaTable`."""
 
@@ -98,6 +112,111 @@ class SchemaTableField(SchemaMetaField):
     """Breif description; forwarded to `schemaspec.schema.SchemaTable` constructor."""
 
 
+_MISSING = dataclasses.MISSING
+_DEFAULT_TABLE_FIELD = SchemaTableField()
+"""Metadata assumed for fields which do not set any."""
+
+
+def _default_value(field: dataclasses.Field) -> Any:
+    """Default value of `field`, calling its factory or type if needed."""
+    if field.default_factory is not _MISSING:
+        return field.default_factory()
+    if field.default is not _MISSING:
+        return field.default
+    return field.type()
+
+
+def _default_factory(field: dataclasses.Field, cls: type) -> Callable[[], Any]:
+    """No parameter callable which returns the default of `field` of type `cls`."""
+    if field.default_factory is not _MISSING:
+        return field.default_factory
+    if field.default is not _MISSING:
+        return lambda default=field.default: default
+    return cls
+
+
+class _ItemStep(NamedTuple):
+    """Recorded `schemaspec.schema.SchemaTable.add_item()` call."""
+
+    name: str
+    possible_values: tuple[adapters.TypeAdapter, ...]
+    default: Any
+    description: str
+
+
+class _TableStep(NamedTuple):
+    """Recorded `schemaspec.schema.SchemaTable.add_subtable()` call."""
+
+    name: str
+    make_cls: Callable[[], Any]
+    description: str
+    cls: type
+    """Dataclass whose plan initializes the subtable."""
+
+
+type _Plan = tuple[_ItemStep | _TableStep, ...]
+
+_PLAN_CACHE: weakref.WeakKeyDictionary[type, _Plan] = weakref.WeakKeyDictionary()
+"""Plans already built by `_plan_of()`, keyed by their dataclass."""
+
+
+def _item_step(field: dataclasses.Field, data: SchemaItemField) -> _ItemStep:
+    """Plan `field` as a `schemaspec.schema.SchemaItem`."""
+    return _ItemStep(
+        name=field.name,
+        possible_values=data.possible_values,
+        default=_default_value(field),
+        description=data.description or "",
+    )
+
+
+def _table_step(field: dataclasses.Field, data: SchemaTableField) -> _TableStep:
+    """Plan `field` as a `schemaspec.schema.SchemaTable`."""
+    cls = field.type
+    if not isinstance(cls, type):
+        raise TypeError(f"{cls} needs to be a dataclass")
+    return _TableStep(
+        name=field.name,
+        make_cls=_default_factory(field, cls),
+        description=data.description or "",
+        cls=cls,
+    )
+
+
+_DISPATCH: dict[
+    type[SchemaMetaField],
+    Callable[[dataclasses.Field, Any], _ItemStep | _TableStep],
+] = {
+    SchemaItemField: _item_step,
+    SchemaTableField: _table_step,
+}
+"""Field planners of `_build_plan()`, keyed by exact metadata type."""
+
+
+def _build_plan(cls: type) -> _Plan:
+    """Walk the fields of `cls` once and record how to build its schema."""
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls} needs to be a dataclass")
+    default_data = _DEFAULT_TABLE_FIELD
+    dispatch = _DISPATCH
+    steps = []
+    for field in dataclasses.fields(cls):
+        data = field.metadata.get(METADATA_KEY, default_data)
+        planner = dispatch.get(type(data))
+        if planner is None:
+            raise ValueError(f"Schema metadata needs to be set")
+        steps.append(planner(field, data))
+    return tuple(steps)
+
+
+def _plan_of(cls: type) -> _Plan:
+    """Cached `_build_plan()`."""
+    plan = _PLAN_CACHE.get(cls)
+    if plan is None:
+        plan = _PLAN_CACHE[cls] = _build_plan(cls)
+    return plan
+
+
 def __schema_from[
     T
 ](cls: type[T], schema_root: schema.SchemaTable[T],) -> schema.SchemaTable[T]:
@@ -110,37 +229,24 @@ def __schema_from[
 
     :return `schema_root` after configuration.
     """
-    if not dataclasses.is_dataclass(cls):
-        raise TypeError(f"{cls} needs to be a dataclass")
-    for field in dataclasses.fields(cls):
-        data = field.metadata.get(METADATA_KEY, SchemaTableField())
-        default_factory = None
-        if field.default_factory is not dataclasses.MISSING:
-            default_factory = field.default_factory
-        elif field.default is not dataclasses.MISSING:
-            default_factory = lambda: field.default
+    for step in _plan_of(cls):
+        if isinstance(step, _ItemStep):
+            schema_root.add_item(
+                name=step.name,
+                possible_values=step.possible_values,
+                default=step.default,
+                description=step.description,
+            )
         else:
-            default_factory = lambda: field.type()
-        match data:
-            case SchemaItemField():
-                schema_root.add_item(
-                    name=field.name,
-                    possible_values=data.possible_values,
-                    default=default_factory(),
-                    description=data.description or "",
-                )
-            case SchemaTableField():
-                schema_subtable = schema_root.add_subtable(
-                    make_cls=default_factory,
-                    name=field.name,
-                    description=data.description or "",
-                )
-                __schema_from(field.type, schema_subtable)
-            case _:
-                raise ValueError(f"Schema metadata needs to be set")
-
-    def format_str(self) -> str:
-        return schema_root.format_export(namespace=self)
+            schema_subtable = schema_root.add_subtable(
+                make_cls=step.make_cls,
+                name=step.name,
+                description=step.description,
+            )
+            __schema_from(step.cls, schema_subtable)
+
+    def format_str(self, _format_export=schema_root.format_export) -> str:
+        return _format_export(self)
 
     cls.__str__ = format_str
     return schema_root
@@ -151,10 +257,18 @@ def schema_from[T](cls: type[T]) -> schema.Schema[T]:
 
     Sets `cls.__str__(self)` to `schemaspec.schema.Schema.format_export(self)` of the resulting schema.
 
+    The schema is created once per class; later calls return the same instance
+    without walking `cls` again or re-assigning `cls.__str__`. Since the instance is
+    shared, changes made to it (e.g. `add_item()`) are seen by every caller.
+
     :param `cls`: Class whose fields define a schema. Must be a dataclass.
 
-    :return: New `schemaspec.schema.Schema[T]` instance.
+    :return: `schemaspec.schema.Schema[T]` instance for `cls`.
     """
+    schema_root = vars(cls).get(_SCHEMA_ATTR)
+    if schema_root is not None:
+        return schema_root
     schema_root = schema.Schema(make_cls=lambda: cls(), description="")
     __schema_from(cls=cls, schema_root=schema_root)
+    setattr(cls, _SCHEMA_ATTR, schema_root)
     return schema_root
@@ -9,20 +9,124 @@ __all__ = [
     "Schema",
     "SchemaItem",
     "SchemaTable",
+    "UnexpectedKeysError",
 ]
 
+import copy
 import dataclasses
 import enum
-import itertools
+import functools
+import os
 import pathlib
+import sys
 import textwrap
 import tomllib
 from typing import Callable, Iterable, Optional, override
 
 from schemaspec import adapters
 
+_MISSING = dataclasses.MISSING
+_WRAPPER = textwrap.TextWrapper(tabsize=4)
+"""Wraps `SchemaItem.description` paragraphs in help texts."""
+
+
+@functools.lru_cache
+def _joined_type_spec(specs: tuple[str, ...]) -> str:
+    """`specs` joined as alternatives; shared by items with the same adapters."""
+    return " | ".join(specs)
+
+
+@functools.lru_cache
+def _split_keys(keys: tuple[str, ...]) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Split each of `keys` into its first part and the dotted remainder, if any."""
+    return tuple(
+        (root_key, tuple(child_keys))
+        for root_key, *child_keys in (key.split(".", maxsplit=1) for key in keys)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _read_toml(
+    path: str,
+    mtime_ns: int,
+    ctime_ns: int,
+    size: int,
+    inode: int,
+) -> dict[str, adapters.BaseType]:
+    """Parsed contents of the toml file at absolute `path`.
+
+    The remaining parameters only key the cache, so an edited or replaced file is
+    parsed again. The result is shared between calls and must not be modified.
+    """
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _candidates(
+    possible_values: tuple[adapters.TypeAdapter, ...],
+    value_type: type,
+    types_attr: str,
+) -> tuple[adapters.TypeAdapter, ...]:
+    """Adapters, in priority order, which do not rule out values of `value_type`.
+
+    Only a `types_attr` declared by the adapter's own class is trusted; a subclass
+    may widen what its inherited methods accept without redeclaring it.
+
+    :param `types_attr`: Name of the adapter attribute listing accepted types.
+    """
+    return tuple(
+        adapter
+        for adapter in possible_values
+        if (types := vars(type(adapter)).get(types_attr)) is None
+        or issubclass(value_type, types)
+    )
+
+
+def _no_result(value: object) -> None:
+    return None
+
+
+def _first_result[
+    V, R
+](methods: tuple[Callable[[V], R | None], ...]) -> Callable[[V], R | None]:
+    """Callable returning the first non-`None` result of `methods`, in order.
+
+    A single method is returned as is, skipping the loop.
+    """
+    if not methods:
+        return _no_result
+    if len(methods) == 1:
+        return methods[0]
+
+    def first_result(value: V) -> R | None:
+        for fn in methods:
+            result = fn(value)
+            if result is not None:
+                return result
+        return None
+
+    return first_result
+
+
+def _dict_backed(cls: type, keys: Iterable[str]) -> bool:
+    """True if setting `keys` on an instance of `cls` only writes its `__dict__`."""
+    if (
+        cls.__dictoffset__ == 0
+        or cls.__setattr__ is not object.__setattr__
+        or cls.__getattribute__ is not object.__getattribute__
+    ):
+        return False
+    for key in keys:
+        for base in cls.__mro__:
+            attr = vars(base).get(key, _MISSING)
+            if attr is not _MISSING:
+                if hasattr(type(attr), "__set__") or hasattr(type(attr), "__delete__"):
+                    return False
+                break
+    return True
+
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SchemaItem[T]:
     """Key-value schema. Smallest whole unit of a `Schema`"""
 
@@ -34,41 +138,68 @@ class SchemaItem[T]:
     """Value to be used if none is specified."""
     description: str
     """Summary of what is being configured. Appears in `help_str()`."""
+    full_name: str = ""
+    """Name including parent tables, i.e. 'parent.child'; defaults to `short_name`."""
     type_spec: str = dataclasses.field(init=False)
     """Combined types from `possible_values`"""
     default_input: str = dataclasses.field(init=False)
     """Exported `default_value`."""
-    help_str: str = dataclasses.field(init=False)
-    """Summary details of this item's possibilities and constraints."""
+    _help_str: str | None = dataclasses.field(
+        init=False, repr=False, compare=False, default=None
+    )
+    """Cached `help_str`; `None` until first requested."""
+    _convert_cache: dict[type, Callable[[adapters.BaseType], T | None]] = (
+        dataclasses.field(init=False, repr=False, compare=False, default_factory=dict)
+    )
+    """`convert()` specialized to the input type it is keyed by."""
+    _export_cache: dict[type, Callable[[T], str | None]] = dataclasses.field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    """`export()` specialized to the value type it is keyed by."""
+    _valid_cache: dict[type, tuple[adapters.TypeAdapter, ...]] = dataclasses.field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    """`possible_values` which may accept a value, keyed by value type."""
 
     def __post_init__(self):
+        if type(self.possible_values) is not tuple:
+            object.__setattr__(self, "possible_values", tuple(self.possible_values))
+        if not self.full_name:
+            object.__setattr__(self, "full_name", self.short_name)
         object.__setattr__(
             self,
             "type_spec",
-            " | ".join(
-                [x.type_spec for x in self.possible_values],
-            ),
+            _joined_type_spec(tuple([x.type_spec for x in self.possible_values])),
         )
         temp = self.export(self.default_value)
         if temp is None:
             raise ValueError("Default value cannot be exported.")
         object.__setattr__(self, "default_input", temp)
+
+    @property
+    def help_str(self) -> str:
+        """Summary details of this item's possibilities and constraints."""
+        if self._help_str is not None:
+            return self._help_str
         sects = []
-        wrapper = textwrap.TextWrapper(tabsize=4)
-        desc = "\n".join(map(wrapper.fill, self.description.split("\n\n")))
+        desc = "\n".join(map(_WRAPPER.fill, self.description.split("\n\n")))
         if desc:
             sects.append(desc)
         sects.append(f"Default: {self.default_input}")
         usage = f"{self.short_name} = {self.type_spec}"
-        object.__setattr__(
-            self,
-            "help_str",
-            f"{usage}\n{textwrap.indent("\n".join(sects), "  ")}",
-        )
+        help_str = f"{usage}\n{textwrap.indent("\n".join(sects), "  ")}"
+        object.__setattr__(self, "_help_str", help_str)
+        return help_str
 
     def is_valid(self, value: T) -> bool:
         """True if `value` is valid to at least one adapter in `possible_values`."""
-        for adapter in self.possible_values:
+        value_type = type(value)
+        candidates = self._valid_cache.get(value_type)
+        if candidates is None:
+            candidates = self._valid_cache[value_type] = _candidates(
+                self.possible_values, value_type, "_export_types"
+            )
+        for adapter in candidates:
             if adapter.is_valid(value):
                 return True
         return False
@@ -81,22 +212,49 @@ class SchemaItem[T]:
 
         :return: Value as a schema string or None if it is not possible.
         """
-        for schema_v in self.possible_values:
-            v = schema_v.export(value)
-            if v is not None:
-                return v
-        return None
+        value_type = type(value)
+        export = self._export_cache.get(value_type)
+        if export is None:
+            candidates = _candidates(self.possible_values, value_type, "_export_types")
+            export = self._export_cache[value_type] = _first_result(
+                tuple([adapter.export for adapter in candidates])
+            )
+        return export(value)
 
     def convert(self, value: adapters.BaseType) -> T | None:
         """Convert from schema-primative `input` to full internal type `T`.
 
         :return: A new instance of `T`, or None if it cannot be done.
         """
-        for schema_v in self.possible_values:
-            v = schema_v.convert(value)
-            if v is not None:
-                return v
-        return None
+        value_type = type(value)
+        convert = self._convert_cache.get(value_type)
+        if convert is None:
+            candidates = _candidates(self.possible_values, value_type, "_convert_types")
+            convert = self._convert_cache[value_type] = _first_result(
+                tuple([adapter.convert for adapter in candidates])
+            )
+        return convert(value)
+
+    def _converter(self) -> Callable[[adapters.BaseType], T | None]:
+        """`convert`, or the sole adapter's own `convert` if there is only one.
+
+        Adapters already return `None` for input they cannot convert, so a single
+        adapter needs neither the per-type lookup nor the first-result loop.
+        """
+        if len(self.possible_values) == 1:
+            return self.possible_values[0].convert
+        return self.convert
+
+
+class UnexpectedKeysError(KeyError):
+    """`SchemaTable.parse_data()` input contains keys the schema does not define."""
+
+    keys: tuple[str, ...]
+    """Sorted names of the unexpected keys."""
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys = tuple(sorted(map(str, keys)))
+        super().__init__(f"Unexpected keys: {", ".join(self.keys)}")
 
 
 class OnConversionError(enum.Enum):
@@ -114,9 +272,94 @@ class OnConversionError(enum.Enum):
     """Raise an error."""
 
 
+def _handle_ignore(
+    namespace: object,
+    schema: SchemaItem,
+    value: adapters.BaseType,
+    table_name: str,
+) -> None:
+    pass
+
+
+def _handle_set_none(
+    namespace: object,
+    schema: SchemaItem,
+    value: adapters.BaseType,
+    table_name: str,
+) -> None:
+    setattr(namespace, schema.short_name, None)
+
+
+def _handle_set_default(
+    namespace: object,
+    schema: SchemaItem,
+    value: adapters.BaseType,
+    table_name: str,
+) -> None:
+    setattr(namespace, schema.short_name, schema.default_value)
+
+
+def _handle_remove(
+    namespace: object,
+    schema: SchemaItem,
+    value: adapters.BaseType,
+    table_name: str,
+) -> None:
+    if hasattr(namespace, schema.short_name):
+        delattr(namespace, schema.short_name)
+
+
+def _handle_fail(
+    namespace: object,
+    schema: SchemaItem,
+    value: adapters.BaseType,
+    table_name: str,
+) -> None:
+    msg = (
+        f"{schema.short_name} in {table_name or "root"} table"
+        f" cannot convert '{value!r}' to an appropriate value.\n"
+        f"\nHelp:\n{schema.help_str}"
+    )
+    raise ValueError(msg)
+
+
+_HANDLERS: dict[
+    OnConversionError,
+    Callable[[object, SchemaItem, adapters.BaseType, str], None],
+] = {
+    OnConversionError.IGNORE: _handle_ignore,
+    OnConversionError.SET_NONE: _handle_set_none,
+    OnConversionError.SET_DEFAULT: _handle_set_default,
+    OnConversionError.REMOVE: _handle_remove,
+    OnConversionError.FAIL: _handle_fail,
+}
+"""Action of `SchemaTable.parse_data()` for an item it cannot convert."""
+
+type _ParseStep = tuple[str, Callable[[adapters.BaseType], object], object, SchemaItem]
+"""Key, converter, default value and schema of one item."""
+
+type _Child = "SchemaItem | SchemaTable"
+"""Direct child of a `SchemaTable`."""
+
+type _FlatStep = tuple[int, str, "SchemaTable", str]
+"""Depth, key in the parent, table and the separator written before its export."""
+
+type _ExportStep = tuple[
+    int,
+    str,
+    Callable[[], object],
+    str,
+    tuple[tuple[str, Callable[[object], str | None], str], ...],
+]
+"""Depth, key in the parent, namespace factory, text before the items and each
+item's name, exporter and text before its value."""
+
+
 class SchemaTable[T](adapters.TypeAdapter[T]):
     """Table of key-value options and/or subtables."""
 
+    _convert_types = (dict,)
+
     def __init__(
         self,
         make_cls: Callable[[], T],
@@ -135,10 +378,64 @@ class SchemaTable[T](adapters.TypeAdapter[T]):
         self.__description = description
         self.__items: dict[str, SchemaItem] = {}
         self.__subtables: dict[str, SchemaTable] = {}
+        self.__children: dict[str, _Child] | None = None
+        self.__child_items: tuple[tuple[str, _Child], ...] | None = None
         self.__make_cls: Callable[[], T] = make_cls
+        self.__parent: SchemaTable | None = None
+        self.__allowed_keys: frozenset[str] | None = None
+        self.__help_str: str | None = None
+        self.__flat_plan: tuple[_FlatStep, ...] | None = None
+        self.__export_plans: dict[tuple[bool, bool], tuple[_ExportStep, ...]] = {}
+        self.__dict_backed: dict[type, bool] = {}
+        self.__parse_plan: tuple[_ParseStep, ...] | None = None
+
+    def _invalidate(self) -> None:
+        """Drop state derived from children; called whenever the schema changes."""
+        self.__parse_plan = None
+        self.__children = None
+        self.__child_items = None
+        self.__allowed_keys = None
+        self.__dict__.pop("type_spec", None)
+        self.__help_str = None
+        self.__flat_plan = None
+        self.__export_plans.clear()
+        self.__dict_backed.clear()
+        if self.__parent is not None:
+            self.__parent._invalidate()
+
+    def __getattr__(self, name: str) -> str:
+        # `type_spec` is only built when read, then kept until `_invalidate()`.
+        if name != "type_spec":
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        l = [f"{k} = {v.type_spec}" for k, v in self.__child_map().items()]
+        self.type_spec = type_spec = f"{{ {", ".join(l)} }}"
+        return type_spec
+
+    def __child_map(self) -> dict[str, _Child]:
+        """Items, then subtables, by name; cached until `_invalidate()`."""
+        children = self.__children
+        if children is None:
+            children = self.__children = self.__items | self.__subtables
+        return children
+
+    def __child_pairs(self) -> tuple[tuple[str, _Child], ...]:
+        """`__child_map()` items as a tuple; cached until `_invalidate()`."""
+        pairs = self.__child_items
+        if pairs is None:
+            pairs = self.__child_items = tuple(self.__child_map().items())
+        return pairs
+
+    def __keys(self) -> frozenset[str]:
+        """Names of all children; cached until `_invalidate()`."""
+        keys = self.__allowed_keys
+        if keys is None:
+            keys = self.__allowed_keys = frozenset(self.__child_map())
+        return keys
 
     def _fullname_of(self, name: str) -> str:
-        return f"{self.__fullname}.{name}" if self.__fullname else name
+        return sys.intern(f"{self.__fullname}.{name}") if self.__fullname else name
 
     def add_item[
         R
@@ -157,13 +454,16 @@ class SchemaTable[T](adapters.TypeAdapter[T]):
 
         :return: The new instance of `SchemaItem()`.
         """
+        name = sys.intern(name)
         item = SchemaItem(
             short_name=name,
             possible_values=possible_values,
             default_value=default,
             description=description,
+            full_name=self._fullname_of(name),
         )
         self.__items[name] = item
+        self._invalidate()
         return item
 
     def add_subtable[
@@ -183,22 +483,58 @@ class SchemaTable[T](adapters.TypeAdapter[T]):
 
         :return: The created subtable.
         """
+        name = sys.intern(name)
         table = SchemaTable(
             make_cls=make_cls,
             full_name=self._fullname_of(name),
             description=description,
         )
+        table.__parent = self
         self.__subtables[name] = table
+        self._invalidate()
         return table
 
+    def _parse_plan(self) -> tuple[_ParseStep, ...]:
+        """Per-item steps of `parse_data()`."""
+        if self.__parse_plan is None:
+            self.__parse_plan = tuple(
+                (key, schema._converter(), schema.default_value, schema)
+                for key, schema in self.__items.items()
+            )
+        return self.__parse_plan
+
+    def _flat_plan(self) -> tuple[_FlatStep, ...]:
+        """This table followed by every nested subtable, in pre-order."""
+        if self.__flat_plan is None:
+            plan = []
+            stack: list[_FlatStep] = [(0, "", self, "")]
+            while stack:
+                step = stack.pop()
+                plan.append(step)
+                depth, _, table, _ = step
+                children = []
+                sep = "\n\n" if table.__items else ""
+                for key, subtable in table.__subtables.items():
+                    children.append((depth + 1, key, subtable, sep))
+                    sep = "\n\n"
+                stack.extend(reversed(children))
+            self.__flat_plan = tuple(plan)
+        return self.__flat_plan
+
     def help_str(self) -> str:
         """Return a string providing schema description and usage information."""
-        header = f"[{self.__fullname}]\n" if self.__fullname else ""
-        if self.__description:
-            header = f"{header}{self.__description}\n\n"
-        vals = "\n".join([x.help_str for x in self.__items.values()])
-        subs = "\n\n".join([x.help_str() for x in self.__subtables.values()])
-        return f"{header}{"\n\n".join([x for x in [vals, subs] if x])}"
+        if self.__help_str is not None:
+            return self.__help_str
+        parts = []
+        for _, _, table, sep in self._flat_plan():
+            parts.append(sep)
+            if table.__fullname:
+                parts.append(f"[{table.__fullname}]\n")
+            if table.__description:
+                parts.append(f"{table.__description}\n\n")
+            parts.append("\n".join([x.help_str for x in table.__items.values()]))
+        self.__help_str = "".join(parts)
+        return self.__help_str
 
     def parse_data(
         self,
@@ -222,51 +558,74 @@ class SchemaTable[T](adapters.TypeAdapter[T]):
 
         :return: Populated `namespace` or output of `make_cls()`.
 
-        :raises: `KeyError` if unexpected key in `data`
+        :raises: `UnexpectedKeysError` if unexpected key in `data`
         :raises: `TypeError` if expected child of `data` to be dict-like.
         :raises: `ValueError` if a schema-value cannot be converted to its full type,
             and `error_mode` is `OnConversionError.FAIL`.
         """
+        self.__check_keys(data)
         if namespace is None:
             namespace = self.__make_cls()
-        for key, schema in self.__items.items():
-            if key in data:
-                value = data.pop(key)
-                result = schema.convert(value)
+        handle = _HANDLERS[error_mode]
+        datas = [data]
+        spaces: list[object] = [namespace]
+        for depth, key, table, _ in self._flat_plan():
+            if depth:
+                del datas[depth:], spaces[depth:]
+                subdata = datas[-1].get(key, _MISSING)
+                if subdata is _MISSING:
+                    subdata = {}
+                elif not isinstance(subdata, dict):
+                    raise TypeError(f'Schema expects table (dic) "{table.__fullname}"')
+                table.__check_keys(subdata)
+                subspace = getattr(spaces[-1], key, None)
+                if subspace is None:
+                    subspace = table.__make_cls()
+                setattr(spaces[-1], key, subspace)
+                datas.append(subdata)
+                spaces.append(subspace)
+            table.__parse_items(datas[-1], spaces[-1], handle)
+        return namespace
+
+    def __check_keys(self, data: dict[str, adapters.BaseType]) -> None:
+        unknown = data.keys() - self.__keys()
+        if unknown:
+            raise UnexpectedKeysError(unknown)
+
+    def __parse_items(
+        self,
+        data: dict[str, adapters.BaseType],
+        namespace: T,
+        handle: Callable[[T, SchemaItem, adapters.BaseType, str], None],
+    ) -> None:
+        cls = type(namespace)
+        dict_backed = self.__dict_backed.get(cls)
+        if dict_backed is None:
+            dict_backed = self.__dict_backed[cls] = _dict_backed(cls, self.__items)
+        if dict_backed:
+            # Plain attributes: skip the descriptor protocol and write `__dict__`.
+            ns_dict = namespace.__dict__
+            for key, convert, default, schema in self._parse_plan():
+                value = data.get(key, _MISSING)
+                if value is not _MISSING:
+                    result = convert(value)
+                    if result is not None:
+                        ns_dict[key] = result
+                    else:
+                        handle(namespace, schema, value, self.__fullname)
+                elif key not in ns_dict and not hasattr(namespace, key):
+                    ns_dict[key] = default
+            return
+        for key, convert, default, schema in self._parse_plan():
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                result = convert(value)
                 if result is not None:
                     setattr(namespace, key, result)
-                    continue
-                match error_mode:
-                    case OnConversionError.FAIL:
-                        msg = (
-                            f"{schema.short_name} in {self.__fullname or "root"} table"
-                            f" cannot convert '{value!r}' to an appropriate value.\n"
-                            f"\nHelp:\n{schema.help_str}"
-                        )
-                        raise ValueError(msg)
-                    case OnConversionError.IGNORE:
-                        continue
-                    case OnConversionError.REMOVE if hasattr(namespace, key):
-                        delattr(namespace, key)
-                    case OnConversionError.SET_DEFAULT:
-                        setattr(namespace, key, schema.default_value)
-                    case OnConversionError.SET_NONE:
-                        setattr(namespace, key, None)
+                else:
+                    handle(namespace, schema, value, self.__fullname)
             elif not hasattr(namespace, key):
-                setattr(namespace, key, schema.default_value)
-        for key, subtable in self.__subtables.items():
-            subdata = data.pop(key, {})
-            if not isinstance(subdata, dict):
-                raise TypeError(f'Schema expects table (dic) "{subtable.__fullname}"')
-            subspace = getattr(namespace, key, subtable.__make_cls())
-            setattr(
-                namespace,
-                key,
-                subtable.parse_data(subdata, namespace=subspace, error_mode=error_mode),
-            )
-        if len(data) > 0:
-            raise KeyError(f"Unexpected keys")
-        return namespace
+                setattr(namespace, key, default)
 
     def format_export(
         self,
@@ -291,8 +650,112 @@ class SchemaTable[T](adapters.TypeAdapter[T]):
 
         :raises: `KeyError` if a key from `keys` cannot be found in this schema.
         """
-        if namespace is None:
-            namespace = self.__make_cls()
+        parts = []
+        self.__format_into(parts, namespace, keys, use_fullname, show_help)
+        return "".join(parts)
+
+    def __format_into(
+        self,
+        parts: list[str],
+        namespace: Optional[T],
+        keys: Optional[Iterable[str]],
+        use_fullname: bool,
+        show_help: bool,
+    ) -> None:
+        """Append the pieces of `format_export()` to `parts`.
+
+        Tables selected by `keys` are visited from an explicit stack, in the same
+        order the nested output is written.
+        """
+        item_sep = "\n\n" if show_help else "\n"
+        stack = [("", self, namespace, keys)]
+        while stack:
+            sep, table, table_ns, table_keys = stack.pop()
+            parts.append(sep)
+            if table_ns is None:
+                table_ns = table.__make_cls()
+            if not table_keys:
+                table.__format_all_into(parts, table_ns, use_fullname, show_help)
+                continue
+            vals = []
+            tables = []
+            for root_key, child_keys in _split_keys(tuple(table_keys)):
+                child = table.__child_map().get(root_key)
+                if child is None:
+                    raise KeyError(f"Schema does not have a child '{root_key}'.")
+                if isinstance(child, SchemaItem):
+                    vals.append(
+                        table.__format_item(child, table_ns, use_fullname, show_help)
+                    )
+                else:
+                    tables.append((child, getattr(table_ns, root_key), child_keys))
+            parts.append(table.__header(use_fullname, show_help))
+            if vals:
+                parts.append(item_sep.join(vals))
+            stack.extend(
+                reversed(
+                    [
+                        ("\n\n" if vals or i else "", child, child_ns, child_keys)
+                        for i, (child, child_ns, child_keys) in enumerate(tables)
+                    ]
+                )
+            )
+
+    def __format_all_into(
+        self,
+        parts: list[str],
+        namespace: T,
+        use_fullname: bool,
+        show_help: bool,
+    ) -> None:
+        """`__format_into()` for all keys, replaying `_export_plan()`."""
+        item_sep = "\n\n" if show_help else "\n"
+        spaces: list[object] = [namespace]
+        for depth, key, make_cls, prefix, items in self._export_plan(
+            use_fullname, show_help
+        ):
+            if depth:
+                del spaces[depth:]
+                table_ns = getattr(spaces[-1], key)
+                spaces.append(make_cls() if table_ns is None else table_ns)
+            table_ns = spaces[-1]
+            parts.append(prefix)
+            parts.append(
+                item_sep.join(
+                    [
+                        f"{lead}{export(getattr(table_ns, name))}"
+                        for name, export, lead in items
+                    ]
+                )
+            )
+
+    def _export_plan(
+        self, use_fullname: bool, show_help: bool
+    ) -> tuple[_ExportStep, ...]:
+        """Everything `format_export()` writes for all keys that does not depend on
+        the namespace, built once for each combination of options."""
+        plan = self.__export_plans.get((use_fullname, show_help))
+        if plan is None:
+            plan = self.__export_plans[use_fullname, show_help] = tuple(
+                (
+                    depth,
+                    key,
+                    table.__make_cls,
+                    sep + table.__header(use_fullname, show_help),
+                    tuple(
+                        (
+                            name,
+                            schema.export,
+                            table.__item_lead(schema, use_fullname, show_help),
+                        )
+                        for name, schema in table.__items.items()
+                    ),
+                )
+                for depth, key, table, sep in self._flat_plan()
+            )
+        return plan
+
+    def __header(self, use_fullname: bool, show_help: bool) -> str:
         header = ""
         if not use_fullname and self.__fullname:
             header = f"[{self.__fullname}]\n"
@@ -303,72 +766,60 @@ class SchemaTable[T](adapters.TypeAdapter[T]):
                 subsequent_indent="# ",
             )
             header = f"{header}{desc}\n\n"
-        vals = []
-        tables = []
-        for key in keys or itertools.chain(
-            self.__items.keys(), self.__subtables.keys()
-        ):
-            child_keys = key.split(".", maxsplit=1)
-            root_key = child_keys.pop(0)
-            if root_key in self.__items:
-                schema = self.__items[root_key]
-                rhs = schema.export(getattr(namespace, root_key))
-                lhs = (
-                    self._fullname_of(schema.short_name)
-                    if use_fullname
-                    else schema.short_name
-                )
-                val = f"{lhs} = {rhs}"
-                if show_help:
-                    help_text = textwrap.indent(schema.help_str, "# ", lambda _: True)
-                    val = f"{help_text}\n{val}"
-                vals.append(val)
-            elif root_key in self.__subtables:
-                subtable_schema = self.__subtables[root_key]
-                subtable_ns = getattr(namespace, root_key)
-                tables.append(
-                    subtable_schema.format_export(
-                        namespace=subtable_ns,
-                        keys=child_keys,
-                        use_fullname=use_fullname,
-                        show_help=show_help,
-                    )
-                )
-            else:
-                raise KeyError(f"Schema does not have a child '{root_key}'.")
-        if vals:
-            tables.insert(0, ("\n\n" if show_help else "\n").join(vals))
-        return f"{header}{"\n\n".join(tables)}"
+        return header
 
-    @property
-    @override
-    def type_spec(self) -> str:
-        l = [
-            f"{k} = {v.type_spec}"
-            for k, v in itertools.chain(self.__items.items(), self.__subtables.items())
-        ]
-        return f"{{ {", ".join(l)} }}"
+    def __format_item(
+        self,
+        schema: SchemaItem,
+        namespace: T,
+        use_fullname: bool,
+        show_help: bool,
+    ) -> str:
+        rhs = schema.export(getattr(namespace, schema.short_name))
+        return f"{self.__item_lead(schema, use_fullname, show_help)}{rhs}"
+
+    def __item_lead(
+        self,
+        schema: SchemaItem,
+        use_fullname: bool,
+        show_help: bool,
+    ) -> str:
+        """Text written before the exported value of `schema`."""
+        lhs = schema.full_name if use_fullname else schema.short_name
+        if show_help:
+            help_text = textwrap.indent(schema.help_str, "# ", lambda _: True)
+            return f"{help_text}\n{lhs} = "
+        return f"{lhs} = "
 
     @override
     def is_valid(self, value: T) -> bool:
-        attrs = {k: v for k, v in vars(value) if not k.startswith("_")}
-        for key, adapter in itertools.chain(
-            self.__items.items(), self.__subtables.items()
-        ):
-            if key not in attrs:
+        attrs = vars(value)
+        if {k for k in attrs if not k.startswith("_")} != self.__keys():
+            return False
+        for key, adapter in self.__child_pairs():
+            if not adapter.is_valid(attrs[key]):
                 return False
-            if not adapter.is_valid(attrs.pop(key)):
-                return False
-        return len(attrs) == 0
+        return True
 
     @override
     def export(self, value: T) -> str | None:
         """Export `value` as an inline-table."""
-        l = [
-            f"{k} = {v.export(getattr(value, k))}"
-            for k, v in itertools.chain(self.__items.items(), self.__subtables.items())
-        ]
-        return f"{{ {", ".join(l)} }}"
+        out = []
+        self._export_into(value, out)
+        return "".join(out)
+
+    def _export_into(self, value: T, out: list[str]) -> None:
+        """Append the pieces of `export()` to `out`, nested tables included."""
+        out.append("{ ")
+        sep = ""
+        for key, child in self.__child_pairs():
+            out.append(f"{sep}{key} = ")
+            if isinstance(child, SchemaTable):
+                child._export_into(getattr(value, key), out)
+            else:
+                out.append(str(child.export(getattr(value, key))))
+            sep = ", "
+        out.append(" }")
 
     @override
     def convert(self, value: adapters.BaseType) -> T | None:
@@ -400,11 +851,18 @@ class Schema[T](SchemaTable[T]):
     ) -> T:
         """Load `filepath` as toml and send output to `parse_data()`.
 
+        Recently loaded files are only parsed again once their status (times, size or
+        inode) changes.
+
         :param `filepath`: Path to a TOML configuration file.
         :param `namespace`: Namespace forwarded to `parse_data()`.
 
         :return: Output of `parse_data()`.
         """
-        with open(filepath, "rb") as f:
-            data = tomllib.load(f)
-        return self.parse_data(data, namespace=namespace)
+        path = os.path.abspath(filepath)
+        stat = os.stat(path)
+        data = _read_toml(
+            path, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino
+        )
+        # The cached dict is shared; converted values may alias its lists and tables.
+        return self.parse_data(copy.deepcopy(data), namespace=namespace)
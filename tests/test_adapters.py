@@ -0,0 +1,143 @@
+import copy
+import dataclasses
+import enum
+import pathlib
+import pickle
+import unittest
+
+from schemaspec import (
+    IntAdapter,
+    ListAdapter,
+    PathAdapter,
+    SchemaItem,
+    SchemaItemField,
+    StringAdapter,
+    schema_from,
+)
+
+
+class Color(enum.StrEnum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class SubPath(pathlib.Path):
+    pass
+
+
+@dataclasses.dataclass(slots=True)
+class PointSpec:
+    x: int = dataclasses.field(
+        default=0,
+        metadata=SchemaItemField(possible_values=(IntAdapter(),)).metadata(),
+    )
+
+
+@dataclasses.dataclass
+class SimpleSpec:
+    x: int = dataclasses.field(
+        default=0,
+        metadata=SchemaItemField(possible_values=(IntAdapter(),)).metadata(),
+    )
+
+
+class TestSubclassValues(unittest.TestCase):
+    def test_enum_choices(self):
+        self.assertEqual(StringAdapter(tuple(Color)).type_spec, '"red" | "blue"')
+        self.assertEqual(IntAdapter(tuple(Level)).type_spec, "1 | 2")
+
+    def test_enum_default(self):
+        item = SchemaItem(
+            short_name="color",
+            possible_values=(StringAdapter(tuple(Color)),),
+            default_value=Color.RED,
+            description="",
+        )
+        self.assertEqual(item.default_input, '"red"')
+        self.assertEqual(item.export(Color.BLUE), '"blue"')
+        self.assertTrue(item.is_valid(Color.BLUE))
+
+    def test_int_rejects_bool(self):
+        self.assertFalse(IntAdapter().is_valid(True))
+        self.assertIsNone(IntAdapter().convert(True))
+
+    def test_path_subclass(self):
+        self.assertEqual(PathAdapter().export(SubPath("a")), '"a"')
+
+
+class TestListAdapter(unittest.TestCase):
+    def test_export_inline_tables(self):
+        adapter = ListAdapter(schema_from(PointSpec))
+        self.assertEqual(
+            adapter.export([PointSpec(1), PointSpec(2)]), "[{ x = 1 }, { x = 2 }]"
+        )
+
+    def test_export_nested_inline_tables(self):
+        adapter = ListAdapter(ListAdapter(schema_from(PointSpec)))
+        self.assertEqual(adapter.export([[PointSpec(1)]]), "[[{ x = 1 }]]")
+
+    def test_export_extra_attribute(self):
+        value = SimpleSpec(1)
+        setattr(value, "extra", 2)
+        adapter = ListAdapter(schema_from(SimpleSpec))
+        self.assertEqual(adapter.export([value]), "[{ x = 1 }]")
+
+    def test_primitive_fast_path(self):
+        adapter = ListAdapter(IntAdapter())
+        value = [1, 2]
+        converted = adapter.convert(value)
+        self.assertEqual(converted, [1, 2])
+        self.assertIsNot(converted, value)
+        self.assertTrue(adapter.is_valid([1, 2]))
+        self.assertFalse(adapter.is_valid([1, True]))
+        self.assertIsNone(adapter.convert([1, True]))
+
+    def test_primitive_subclass_elements(self):
+        adapter = ListAdapter(StringAdapter())
+        self.assertTrue(adapter.is_valid(["a", Color.RED]))
+        self.assertEqual(adapter.export(["a", Color.RED]), '["a", "red"]')
+
+    def test_convert_with_choices(self):
+        adapter = ListAdapter(StringAdapter(("a", "b")))
+        self.assertEqual(adapter.convert(["b", "a"]), ["b", "a"])
+        self.assertIsNone(adapter.convert(["a", "c"]))
+
+    def test_export_invalid_element(self):
+        values: list = [1, "2"]
+        self.assertIsNone(ListAdapter(IntAdapter()).export(values))
+
+
+class TestSharedAdapters(unittest.TestCase):
+    def test_choice_free_is_shared(self):
+        self.assertIs(IntAdapter(), IntAdapter())
+        self.assertIs(PathAdapter(), PathAdapter())
+        self.assertIsNot(IntAdapter((1,)), IntAdapter((1,)))
+
+    def test_subclass_is_not_shared(self):
+        class Sub(IntAdapter):
+            pass
+
+        self.assertIsNot(Sub(), IntAdapter())
+        self.assertIsNot(Sub(), Sub())
+
+    def test_reconstruction_keeps_state(self):
+        shared = StringAdapter()
+        self.assertIs(StringAdapter(), shared)
+        self.assertEqual(shared.type_spec, '"<string>"')
+        self.assertEqual(shared.choices, ())
+
+    def test_copies_keep_choices(self):
+        adapter = IntAdapter((1, 2))
+        for clone in (copy.deepcopy(adapter), pickle.loads(pickle.dumps(adapter))):
+            self.assertEqual(clone.choices, (1, 2))
+            self.assertEqual(clone.type_spec, "1 | 2")
+        self.assertIs(pickle.loads(pickle.dumps(IntAdapter())), IntAdapter())
+
+
+if __name__ == "__main__":
+    unittest.main()
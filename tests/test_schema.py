@@ -0,0 +1,216 @@
+import dataclasses
+import os
+import pathlib
+import tempfile
+import unittest
+from typing import cast
+
+from schemaspec import (
+    BaseType,
+    IntAdapter,
+    Schema,
+    SchemaItemField,
+    TypeAdapter,
+    UnexpectedKeysError,
+    schema_from,
+)
+
+
+@dataclasses.dataclass(unsafe_hash=True)
+class InnerSpec:
+    x: int = dataclasses.field(
+        default=0,
+        metadata=SchemaItemField(possible_values=(IntAdapter(),)).metadata(),
+    )
+
+
+@dataclasses.dataclass
+class OuterSpec:
+    a: InnerSpec = InnerSpec(1)
+    b: InnerSpec = InnerSpec(2)
+
+
+class TestParseData(unittest.TestCase):
+    def test_unexpected_keys(self):
+        schema = schema_from(OuterSpec)
+        with self.assertRaises(UnexpectedKeysError) as ctx:
+            schema.parse_data({"d": 1, "c": 2, "a": {"x": 1}})
+        self.assertIsInstance(ctx.exception, KeyError)
+        self.assertEqual(ctx.exception.keys, ("c", "d"))
+
+    def test_unexpected_subtable_keys(self):
+        schema = schema_from(OuterSpec)
+        with self.assertRaises(UnexpectedKeysError) as ctx:
+            schema.parse_data({"a": {"x": 1, "y": 2}})
+        self.assertEqual(ctx.exception.keys, ("y",))
+
+
+class Namespace:
+    pass
+
+
+class TestSchemaTable(unittest.TestCase):
+    def test_items_before_subtables(self):
+        schema = Schema(make_cls=Namespace, description="")
+        schema.add_item("a", (IntAdapter(),), 1, "")
+        table = schema.add_subtable(make_cls=Namespace, name="t", description="")
+        schema.add_item("b", (IntAdapter(),), 2, "")
+        self.assertEqual(schema.type_spec, "{ a = <integer>, b = <integer>, t = {  } }")
+        table.add_item("c", (IntAdapter(),), 3, "")
+        self.assertEqual(
+            schema.type_spec,
+            "{ a = <integer>, b = <integer>, t = { c = <integer> } }",
+        )
+
+    def test_keys_follow_additions(self):
+        schema = Schema(make_cls=Namespace, description="")
+        schema.add_item("a", (IntAdapter(),), 1, "")
+        with self.assertRaises(UnexpectedKeysError):
+            schema.parse_data({"b": 2})
+        schema.add_item("b", (IntAdapter(),), 2, "")
+        self.assertEqual(getattr(schema.parse_data({"b": 3}), "b"), 3)
+
+
+class TestFormatExportKeys(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(make_cls=Namespace, description="")
+        self.schema.add_item("a", (IntAdapter(),), 1, "")
+        table = self.schema.add_subtable(make_cls=Namespace, name="t", description="")
+        table.add_item("b", (IntAdapter(),), 2, "")
+        subtable = table.add_subtable(make_cls=Namespace, name="u", description="")
+        subtable.add_item("c", (IntAdapter(),), 3, "")
+        self.namespace = self.schema.parse_data({})
+
+    def export(self, keys: list[str], use_fullname: bool = False) -> str:
+        return self.schema.format_export(
+            self.namespace, keys=keys, use_fullname=use_fullname
+        )
+
+    def test_headers(self):
+        self.assertEqual(self.export(["t.b"]), "[t]\nb = 2")
+        self.assertEqual(self.export(["t.u.c", "a"]), "a = 1\n\n[t]\n[t.u]\nc = 3")
+        self.assertEqual(self.export(["t"]), "[t]\nb = 2\n\n[t.u]\nc = 3")
+
+    def test_fullname(self):
+        self.assertEqual(
+            self.export(["t.u.c", "a"], use_fullname=True), "a = 1\n\nt.u.c = 3"
+        )
+        self.assertEqual(self.export(["t"], use_fullname=True), "t.b = 2\n\nt.u.c = 3")
+
+    def test_unknown_key(self):
+        with self.assertRaises(KeyError):
+            self.export(["t.z"])
+
+
+class PropertyNamespace:
+    def __init__(self):
+        self.seen: list[int] = []
+
+    @property
+    def x(self) -> int:
+        return self.seen[-1]
+
+    @x.setter
+    def x(self, value: int):
+        self.seen.append(value)
+
+
+class SetattrNamespace:
+    def __setattr__(self, name: str, value: object):
+        super().__setattr__(name, ("set", value))
+
+
+class SlotsNamespace:
+    __slots__ = ("x",)
+
+
+class TestParseNamespaces(unittest.TestCase):
+    def parse(self, make_cls, data):
+        schema = Schema(make_cls=make_cls, description="")
+        schema.add_item("x", (IntAdapter(),), 0, "")
+        return schema.parse_data(data)
+
+    def test_plain(self):
+        namespace = self.parse(Namespace, {"x": 1})
+        self.assertEqual(vars(namespace), {"x": 1})
+        self.assertEqual(vars(self.parse(Namespace, {})), {"x": 0})
+
+    def test_property(self):
+        namespace = self.parse(PropertyNamespace, {"x": 1})
+        self.assertEqual(namespace.seen, [1])
+        self.assertNotIn("x", vars(namespace))
+
+    def test_setattr(self):
+        self.assertEqual(
+            getattr(self.parse(SetattrNamespace, {"x": 1}), "x"), ("set", 1)
+        )
+
+    def test_slots(self):
+        self.assertEqual(getattr(self.parse(SlotsNamespace, {"x": 1}), "x"), 1)
+
+
+class RawAdapter(TypeAdapter[object]):
+    """Returns parsed values as they are, without copying them."""
+
+    type_spec = "<any>"
+
+    def export(self, value: object) -> str | None:
+        return str(value)
+
+    def convert(self, value: BaseType) -> object | None:
+        return value
+
+
+class TestLoadToml(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = pathlib.Path(tmp.name)
+        self.path = self.dir / "config.toml"
+        self.schema = Schema(make_cls=Namespace, description="")
+        self.schema.add_item("xs", (RawAdapter(),), [], "")
+
+    def load(self) -> object:
+        return getattr(self.schema.load_toml(self.path), "xs")
+
+    def test_results_are_not_shared(self):
+        self.path.write_text("xs = [1, 2]\n")
+        first = self.load()
+        assert isinstance(first, list)
+        first.append(3)
+        self.assertEqual(self.load(), [1, 2])
+
+    def test_replaced_file_is_parsed_again(self):
+        self.path.write_text("xs = [1]\n")
+        self.assertEqual(self.load(), [1])
+        mtime_ns = self.path.stat().st_mtime_ns
+        # Same size and modification time, but a different file.
+        replacement = self.dir / "new.toml"
+        replacement.write_text("xs = [2]\n")
+        os.utime(replacement, ns=(mtime_ns, mtime_ns))
+        os.replace(replacement, self.path)
+        self.assertEqual(self.load(), [2])
+
+
+class TestSchemaFrom(unittest.TestCase):
+    def test_table_defaults_are_per_field(self):
+        schema = schema_from(OuterSpec)
+        # Missing (None) tables are exported from their field's default.
+        missing = cast(InnerSpec, None)
+        self.assertEqual(
+            schema.format_export(namespace=OuterSpec(a=missing, b=missing)),
+            "[a]\nx = 1\n\n[b]\nx = 2",
+        )
+
+
+class TestIsValid(unittest.TestCase):
+    def test_namespace(self):
+        schema = schema_from(OuterSpec)
+        self.assertTrue(schema.is_valid(OuterSpec()))
+        # A value of the wrong type, which the dataclass itself does not reject.
+        invalid = InnerSpec(cast(int, "1"))
+        self.assertFalse(schema.is_valid(OuterSpec(a=invalid)))
+
+
+if __name__ == "__main__":
+    unittest.main()